@@ -37,10 +37,16 @@ SOFTWARE.
 """
 
 import argparse
+import functools
+import json
 import os
+import platform
+import re
 import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Define ANSI color codes
@@ -55,17 +61,45 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Serializes output from worker threads so colored lines don't interleave
+PRINT_LOCK = threading.Lock()
+# Set while run_streaming has an unterminated \r progress line on screen; guarded by PRINT_LOCK
+progress_pending = False
+
+def end_progress_line():
+    """Terminate a pending progress line so the next output starts on its own line.
+
+    Must be called with PRINT_LOCK held.
+    """
+    global progress_pending
+    if progress_pending:
+        sys.stdout.write("\n")
+        progress_pending = False
+
 def colored_print(message, color):
-    print(f"{color}{message}{Colors.ENDC}")
+    with PRINT_LOCK:
+        end_progress_line()
+        print(f"{color}{message}{Colors.ENDC}")
 
 # Shared constants
 BASE_DIR = Path(__file__).resolve().parent / "build"
 DEPOT_TOOLS_PATH = BASE_DIR / "tmp" / "depot_tools"
 DEPOT_TOOLS_URL = "https://chromium.googlesource.com/chromium/tools/depot_tools.git"
 SKIA_GIT_URL = "https://github.com/google/skia.git"
+# Git command for network operations: protocol v2 ref negotiation, and the skipping
+# negotiator to cut round trips on incremental fetches
+GIT = ["git", "-c", "protocol.version=2", "-c", "fetch.negotiationAlgorithm=skipping"]
 SKIA_SRC_DIR = BASE_DIR / "src" / "skia"
+# Bare Skia mirror used as a clone reference; point SKIA_BUILDER_MIRROR at a shared copy on CI
+SKIA_MIRROR = Path(os.environ.get("SKIA_BUILDER_MIRROR") or BASE_DIR / "tmp" / "skia.git")
 TMP_DIR = BASE_DIR / "tmp" / "skia"
 ACTIVATE_EMSDK_PATH = SKIA_SRC_DIR / "bin" / "activate-emsdk"
+TOOLCHAIN_CACHE_PATH = BASE_DIR / ".cache" / "toolchains.json"
+
+# Matches ninja's default "[finished/total] " status prefix
+NINJA_STATUS_RE = re.compile(r"^\[(\d+)/(\d+)\]")
+# Matches the file a git-format patch modifies
+PATCH_PATH_RE = re.compile(r"^diff --git a/(\S+) b/", re.MULTILINE)
 
 # Platform-specific library directories
 MAC_LIB_DIR = BASE_DIR / "mac" / "lib"
@@ -379,6 +413,143 @@ PLATFORM_GN_ARGS_CPU = {
     """
 }
 
+# Static GN args per (variant, platform), assembled once; per-arch args are appended at build time
+BASE_GN_ARGS = {
+    **{("gpu", name): BASIC_GN_ARGS + args + RELEASE_GN_ARGS
+       for name, args in PLATFORM_GN_ARGS.items()},
+    **{("cpu", name): BASIC_GN_ARGS + args + CPU_ONLY_GN_ARGS + RELEASE_GN_ARGS
+       for name, args in PLATFORM_GN_ARGS_CPU.items()},
+}
+
+def run_captured(command, **kwargs):
+    """Run a command with its output buffered and printed in one block once it exits.
+
+    Used for commands running on worker threads so their output doesn't interleave.
+    """
+    result = subprocess.run(command, capture_output=True, text=True, errors="replace", **kwargs)
+    output = result.stdout + result.stderr
+    if output:
+        with PRINT_LOCK:
+            end_progress_line()
+            sys.stdout.write(output)
+            sys.stdout.flush()
+    result.check_returncode()
+    return result
+
+def run_streaming(command, **kwargs):
+    """Run a command, condensing "[N/M]" progress lines into periodic progress updates.
+
+    Anything that isn't a progress line (compiler diagnostics, FAILED: blocks, git
+    messages) is passed through verbatim. On a terminal progress is one line rewritten
+    in place; in logs a line is printed every 10%.
+    """
+    global progress_pending
+    interactive = sys.stdout.isatty()
+    last_percent = -1
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                               text=True, errors="replace", bufsize=1, **kwargs)
+    try:
+        for line in process.stdout:
+            match = NINJA_STATUS_RE.match(line)
+            # A "[n/0]" line carries no usable progress, so pass it through as-is
+            total = int(match.group(2)) if match else 0
+            with PRINT_LOCK:
+                if not total:
+                    end_progress_line()
+                    sys.stdout.write(line)
+                    continue
+
+                finished = int(match.group(1))
+                percent = finished * 100 // total
+                # Redraw if other output has ended the progress line since the last update
+                if interactive and (percent != last_percent or not progress_pending):
+                    sys.stdout.write(f"\r[{finished}/{total}] {percent}%")
+                    sys.stdout.flush()
+                    progress_pending = True
+                elif not interactive and percent // 10 != last_percent // 10:
+                    sys.stdout.write(f"[{finished}/{total}] {percent}%\n")
+                last_percent = percent
+    except BaseException:
+        # Don't leave the child running if reading fails or the user hits Ctrl-C
+        process.kill()
+        process.wait()
+        with PRINT_LOCK:
+            end_progress_line()
+        raise
+
+    process.wait()
+    with PRINT_LOCK:
+        end_progress_line()
+        sys.stdout.flush()
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command)
+
+def is_junk_entry(name):
+    """Check for hidden files/directories (.git*, .DS_Store, ._*) and Python caches that never get packaged."""
+    return name.startswith(".") or name == "__pycache__"
+
+def is_up_to_date(src, dst):
+    """Check whether dst is an unchanged copy or link of src (same size and mtime)."""
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+    except OSError:
+        return False
+    return (src_stat.st_size == dst_stat.st_size and
+            int(src_stat.st_mtime) == int(dst_stat.st_mtime))
+
+def link_or_copy(src, dst):
+    """Hardlink src to dst, falling back to a copy (e.g. across filesystems)."""
+    if os.path.exists(dst):
+        if os.path.samefile(src, dst):
+            return
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+@functools.lru_cache(maxsize=None)
+def host_arch():
+    """Get the host CPU architecture, normalized to "arm64"/"x64" where recognized."""
+    machine = os.uname().machine if hasattr(os, "uname") else platform.machine()
+    machine = machine.lower()
+    if machine in ("arm64", "aarch64"):
+        return "arm64"
+    if machine in ("amd64", "x86_64"):
+        return "x64"
+    return machine
+
+@functools.lru_cache(maxsize=None)
+def find_clang_win():
+    """Find the Clang/LLVM installation on Windows, caching the result in TOOLCHAIN_CACHE_PATH."""
+    def is_llvm_root(path):
+        return bool(path) and (Path(path) / "bin" / "clang-cl.exe").is_file()
+
+    try:
+        cached = json.loads(TOOLCHAIN_CACHE_PATH.read_text()).get("clang_win")
+    except (OSError, ValueError):
+        cached = None
+    if is_llvm_root(cached):
+        return cached
+
+    # A clang-cl on PATH normally lives in <LLVM root>/bin (but may be a shim, e.g. scoop's);
+    # otherwise prefer standalone LLVM, fallback to VS bundled
+    clang_cl = shutil.which("clang-cl.exe")
+    clang_paths = [
+        str(Path(clang_cl).parent.parent) if clang_cl else None,
+        "C:\\Program Files\\LLVM",
+        "C:\\Program Files\\Microsoft Visual Studio\\2022\\Professional\\VC\\Tools\\Llvm\\x64",
+        "C:\\Program Files\\Microsoft Visual Studio\\2022\\Community\\VC\\Tools\\Llvm\\x64",
+        "C:\\Program Files\\Microsoft Visual Studio\\2022\\Enterprise\\VC\\Tools\\Llvm\\x64",
+    ]
+    clang_win = next((path for path in clang_paths if is_llvm_root(path)), None)
+
+    if clang_win:
+        TOOLCHAIN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        TOOLCHAIN_CACHE_PATH.write_text(json.dumps({"clang_win": clang_win}))
+    return clang_win
+
 class SkiaBuildScript:
     def __init__(self):
         self.platform = None
@@ -388,6 +559,7 @@ class SkiaBuildScript:
         self.branch = None
         self.variant = "gpu"
         self.target = "all"  # device, simulator, or all
+        self.cc_wrapper = None
 
     def parse_arguments(self):
         parser = argparse.ArgumentParser(description="Build Skia for macOS, iOS, visionOS, Windows, Linux and WebAssembly")
@@ -400,7 +572,19 @@ class SkiaBuildScript:
                            help="Build variant: cpu (no GPU) or gpu (with Graphite/Dawn)")
         parser.add_argument("-target", choices=["device", "simulator", "all"], default="all",
                            help="Build target for iOS/visionOS: device, simulator, or all")
-        parser.add_argument("--shallow", action="store_true", help="Perform a shallow clone of the Skia repository")
+        parser.add_argument("-j", "-jobs", "--jobs", dest="jobs", default=None,
+                           help="Number of parallel ninja jobs, or 'auto' to also cap by available memory "
+                                "(default: $SKIA_BUILDER_JOBS or the available CPU count)")
+        parser.add_argument("--shallow", action="store_true",
+                           help="Deprecated, has no effect: shallow clones are now the default (see --full-clone)")
+        parser.add_argument("--mirror", action="store_true",
+                           help="Keep a bare Skia mirror and clone from it (implied by SKIA_BUILDER_MIRROR)")
+        parser.add_argument("--full-clone", action="store_true",
+                           help="Clone the full Skia history instead of a shallow single-branch clone")
+        parser.add_argument("--force-build", action="store_true",
+                           help="Always regenerate the GN build files, even if the args are unchanged")
+        parser.add_argument("--verbose", action="store_true",
+                           help="Show full ninja output instead of a condensed progress line")
         parser.add_argument("--zip-all", action="store_true",
                            help="Create a zip archive containing all platform libraries")
         parser.add_argument("--strip-arm64e", action="store_true",
@@ -423,11 +607,44 @@ class SkiaBuildScript:
         self.branch = args.branch
         self.variant = args.variant
         self.target = args.target
-        self.shallow_clone = args.shallow
+        self.shallow_clone = not args.full_clone
+        self.use_mirror = args.mirror or bool(os.environ.get("SKIA_BUILDER_MIRROR"))
+        self.force_build = args.force_build
+        self.verbose = args.verbose
         self.create_zip_all = args.zip_all
         self.strip_arm64e = args.strip_arm64e
+        self.jobs = self.get_job_count(args.jobs)
         self.validate_archs()
 
+    def get_job_count(self, jobs):
+        """Resolve the -jobs option (or SKIA_BUILDER_JOBS) to a ninja job count."""
+        if jobs is None:
+            jobs = os.environ.get("SKIA_BUILDER_JOBS")
+        if jobs is not None and jobs != "auto":
+            try:
+                count = int(jobs)
+            except ValueError:
+                count = 0
+            if count < 1:
+                colored_print(f"Invalid job count: {jobs}", Colors.FAIL)
+                sys.exit(1)
+            return count
+
+        # Respect the CPU affinity mask where available (cpusets; not cgroup CPU quotas)
+        if hasattr(os, "sched_getaffinity"):
+            cpus = len(os.sched_getaffinity(0))
+        else:
+            cpus = os.cpu_count() or 1
+
+        if jobs == "auto":
+            # Allow roughly 2 GB per job so the link steps don't run out of memory
+            try:
+                total_mem = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+                cpus = max(1, min(cpus, total_mem // (2 * 1024 ** 3)))
+            except (AttributeError, ValueError, OSError):
+                pass
+        return cpus
+
     def get_default_archs(self):
         if self.platform == "mac":
             return ["universal"]
@@ -472,47 +689,65 @@ class SkiaBuildScript:
         else:  # Windows
             return BASE_DIR / f"win{variant_suffix}" / "lib"
 
+    def get_build_dir(self, arch):
+        """Get the GN/ninja output directory for an architecture of the current platform."""
+        return TMP_DIR / f"{self.platform}_{self.config}_{arch}_{self.variant}"
+
     def setup_depot_tools(self):
         if not DEPOT_TOOLS_PATH.exists():
-            subprocess.run(["git", "clone", DEPOT_TOOLS_URL, str(DEPOT_TOOLS_PATH)], check=True)
-        os.environ["PATH"] = f"{DEPOT_TOOLS_PATH}:{os.environ['PATH']}"
+            run_captured([*GIT, "clone", DEPOT_TOOLS_URL, str(DEPOT_TOOLS_PATH)])
 
     def sync_deps(self):
-        os.chdir(SKIA_SRC_DIR)
         colored_print("Syncing Deps...", Colors.OKBLUE)
-        subprocess.run([sys.executable, "tools/git-sync-deps"], check=True)
 
-    def generate_gn_args(self, arch: str):
-        output_dir = TMP_DIR / f"{self.platform}_{self.config}_{arch}_{self.variant}"
-        gn_args = BASIC_GN_ARGS
+        env = os.environ.copy()
+        env["GIT_SYNC_DEPS_QUIET"] = "1"
+        exclude_deps = EXCLUDE_DEPS
+        if self.platform == "wasm":
+            # WebAssembly builds need emscripten, everything else can skip downloading it
+            exclude_deps = [dep for dep in EXCLUDE_DEPS if not dep.endswith("/emsdk")]
+        else:
+            env["GIT_SYNC_DEPS_SKIP_EMSDK"] = "1"
 
+        # git-sync-deps resolves checkout paths relative to the DEPS file, so the
+        # filtered copy has to live next to the original
+        filtered_deps = SKIA_SRC_DIR / "DEPS.filtered"
+        self.modify_deps(filtered_deps, exclude_deps)
+        env["GIT_SYNC_DEPS_PATH"] = str(filtered_deps)
+        try:
+            run_streaming([sys.executable, str(SKIA_SRC_DIR / "tools" / "git-sync-deps")],
+                          env=env, cwd=SKIA_SRC_DIR)
+        finally:
+            filtered_deps.unlink()
+
+    def generate_gn_args(self, arch: str):
+        output_dir = self.get_build_dir(arch)
         # Use CPU or GPU platform-specific args based on variant
-        if self.variant == "cpu":
-            gn_args += PLATFORM_GN_ARGS_CPU[self.platform]
-            gn_args += CPU_ONLY_GN_ARGS
-        else:
-            gn_args += PLATFORM_GN_ARGS[self.platform]
-        gn_args += RELEASE_GN_ARGS
+        parts = [BASE_GN_ARGS[(self.variant, self.platform)]]
 
         if self.config == 'Debug':
-            gn_args += "is_debug = true\n"
-            gn_args += "is_official_build = false\n"
+            parts.append("is_debug = true")
+            parts.append("is_official_build = false")
         else:
-            gn_args += "is_debug = false\n"
-            gn_args += "is_official_build = true\n"
+            parts.append("is_debug = false")
+            parts.append("is_official_build = true")
+
+        self.cc_wrapper = self.setup_compiler_cache()
+        if self.cc_wrapper:
+            parts.append(f'cc_wrapper = "{self.cc_wrapper}"')
 
         if self.platform == "mac":
-            gn_args += f"target_cpu = \"{arch}\""
+            parts.append(f"target_cpu = \"{arch}\"")
         elif self.platform == "ios":
             cpu = "arm64" if arch == "arm64" else "x64"
-            gn_args += f'target_cpu = "{cpu}"\n'
+            parts.append(f'target_cpu = "{cpu}"')
 
             # Determine if this is a simulator build
             # x86_64 is always simulator, arm64 depends on target setting
             is_simulator = (arch == "x86_64") or (self.target == "simulator")
 
             # Pass simulator flag to Dawn build (needed for arm64 simulator on Apple Silicon)
-            gn_args += f'ios_use_simulator = {"true" if is_simulator else "false"}\n'
+            parts.append(f'ios_use_simulator = {"true" if is_simulator else "false"}')
 
             if is_simulator:
                 # iOS Simulator build - need explicit SDK and target
@@ -522,12 +757,11 @@ class SkiaBuildScript:
                 )
                 sdk_path = sdk_result.stdout.strip()
                 colored_print(f"Using iOS Simulator SDK: {sdk_path}", Colors.OKBLUE)
-                gn_args += f'''extra_cflags = [
+                parts.append(f'''extra_cflags = [
         "-target", "{arch}-apple-ios{IOS_MIN_VERSION}-simulator",
         "-isysroot", "{sdk_path}",
         "-I../../../src/skia/third_party/externals/expat/lib"
-    ]
-'''
+    ]''')
             else:
                 # iOS Device build - use default SDK
                 sdk_result = subprocess.run(
@@ -536,14 +770,13 @@ class SkiaBuildScript:
                 )
                 sdk_path = sdk_result.stdout.strip()
                 colored_print(f"Using iOS Device SDK: {sdk_path}", Colors.OKBLUE)
-                gn_args += f'''extra_cflags = [
+                parts.append(f'''extra_cflags = [
         "-target", "{arch}-apple-ios{IOS_MIN_VERSION}",
         "-isysroot", "{sdk_path}",
         "-I../../../src/skia/third_party/externals/expat/lib"
-    ]
-'''
+    ]''')
         elif self.platform == "visionos":
-            gn_args += "target_cpu = \"arm64\"\n"
+            parts.append("target_cpu = \"arm64\"")
 
             # Determine if this is a simulator build
             is_simulator = (self.target == "simulator")
@@ -551,7 +784,7 @@ class SkiaBuildScript:
             target_suffix = "-simulator" if is_simulator else ""
 
             # Pass simulator flag to Dawn build (visionOS uses target_os=ios in GN)
-            gn_args += f'ios_use_simulator = {"true" if is_simulator else "false"}\n'
+            parts.append(f'ios_use_simulator = {"true" if is_simulator else "false"}')
 
             # Get visionOS SDK path dynamically
             sdk_result = subprocess.run(
@@ -564,7 +797,7 @@ class SkiaBuildScript:
 
             # Add extra_cflags and extra_asmflags with target and sysroot to override iOS defaults
             # extra_asmflags is needed for ICU data file (icudtl_dat.o) to get correct platform metadata
-            gn_args += f'''extra_cflags = [
+            parts.append(f'''extra_cflags = [
         "-target", "arm64-apple-xros{VISIONOS_MIN_VERSION}{target_suffix}",
         "-isysroot", "{sdk_path}",
         "-I../../../src/skia/third_party/externals/expat/lib"
@@ -572,47 +805,69 @@ class SkiaBuildScript:
     extra_asmflags = [
         "-target", "arm64-apple-xros{VISIONOS_MIN_VERSION}{target_suffix}",
         "-isysroot", "{sdk_path}"
-    ]
-'''
+    ]''')
         elif self.platform == "win":
-            gn_args += f"extra_cflags = [\"{'/MTd' if self.config == 'Debug' else '/MT'}\"]\n"
+            parts.append(f"extra_cflags = [\"{'/MTd' if self.config == 'Debug' else '/MT'}\"]")
             # Map architecture names to GN target_cpu values
             if arch == "Win32":
-                gn_args += "target_cpu = \"x86\"\n"
+                parts.append("target_cpu = \"x86\"")
             elif arch == "arm64":
-                gn_args += "target_cpu = \"arm64\"\n"
+                parts.append("target_cpu = \"arm64\"")
                 # OpenGL is not supported on Windows ARM64, Dawn/Graphite will be used
-                gn_args += "skia_use_gl = false\n"
+                parts.append("skia_use_gl = false")
             else:  # x64
-                gn_args += "target_cpu = \"x64\"\n"
-            # Find Clang installation - prefer standalone LLVM, fallback to VS bundled
-            clang_paths = [
-                "C:\\Program Files\\LLVM",
-                "C:\\Program Files\\Microsoft Visual Studio\\2022\\Professional\\VC\\Tools\\Llvm\\x64",
-                "C:\\Program Files\\Microsoft Visual Studio\\2022\\Community\\VC\\Tools\\Llvm\\x64",
-                "C:\\Program Files\\Microsoft Visual Studio\\2022\\Enterprise\\VC\\Tools\\Llvm\\x64",
-            ]
-            clang_win = None
-            for path in clang_paths:
-                if os.path.isdir(path):
-                    clang_win = path
-                    break
+                parts.append("target_cpu = \"x64\"")
+            clang_win = find_clang_win()
             if clang_win:
-                gn_args += f"clang_win = \"{clang_win}\"\n"
+                parts.append(f"clang_win = \"{clang_win}\"")
             else:
                 colored_print("Warning: Clang/LLVM not found - build may fail", Colors.WARNING)
         elif self.platform == "linux":
-            gn_args += f"target_cpu = \"{'arm64' if arch == 'arm64' else 'x64'}\"\n"
+            parts.append(f"target_cpu = \"{'arm64' if arch == 'arm64' else 'x64'}\"")
         elif self.platform == "wasm":
-            gn_args += "target_cpu = \"wasm\"\n"
+            parts.append("target_cpu = \"wasm\"")
+
+        gn_args = "\n".join(parts) + "\n"
 
         colored_print(f"Generating gn args for {self.platform} {arch} ({self.variant}) settings:", Colors.OKBLUE)
         colored_print(f"{gn_args}", Colors.OKGREEN)
 
-        subprocess.run(["./bin/gn", "gen", str(output_dir), f"--args={gn_args}"], check=True)
+        # Skip gn gen when args.gn already holds exactly these args and the build files exist.
+        # If an earlier gn gen with them failed, args.gn is newer than build.ninja and ninja
+        # re-runs gn itself, as it does when BUILD.gn/.gni files change.
+        args_file = output_dir / "args.gn"
+        try:
+            current_args = args_file.read_text()
+        except OSError:
+            current_args = None
+        if (not self.force_build and current_args == gn_args and
+                (output_dir / "build.ninja").exists()):
+            colored_print(f"GN args unchanged, skipping gn gen for {output_dir.name}", Colors.OKCYAN)
+            return
+
+        # Write args.gn directly rather than passing --args, which can exceed
+        # the Windows command line length limit
+        output_dir.mkdir(parents=True, exist_ok=True)
+        args_file.write_text(gn_args)
+        subprocess.run([str(SKIA_SRC_DIR / "bin" / "gn"), "gen", str(output_dir)], cwd=SKIA_SRC_DIR, check=True)
+
+    def setup_compiler_cache(self):
+        """Find sccache (preferred) or ccache and configure its environment, returning the wrapper name."""
+        if shutil.which("sccache"):
+            os.environ.setdefault("SCCACHE_CACHE_SIZE", "20G")
+            # Keep the cache under build/tmp so CI can persist it alongside depot_tools
+            os.environ.setdefault("SCCACHE_DIR", str(BASE_DIR / "tmp" / "sccache"))
+            return "sccache"
+
+        if self.platform != "win" and shutil.which("ccache"):
+            # Keep cache keys stable across checkouts at different absolute paths (e.g. CI runners)
+            os.environ.setdefault("CCACHE_BASEDIR", str(BASE_DIR))
+            os.environ.setdefault("CCACHE_COMPILERCHECK", "content")
+            return "ccache"
+        return None
 
     def build_skia(self, arch: str):
-        output_dir = TMP_DIR / f"{self.platform}_{self.config}_{arch}_{self.variant}"
+        output_dir = self.get_build_dir(arch)
         
         # Get the list of libraries for the current platform
         libs_to_build = LIBS[self.platform]
@@ -622,11 +877,15 @@ class SkiaBuildScript:
             libs_to_build = [lib[:-4] if lib.endswith('.lib') else lib for lib in libs_to_build]
         
         # Construct the ninja command with all library targets
-        ninja_command = ["ninja", "-C", str(output_dir)] + libs_to_build
+        ninja_command = ["ninja", "-C", str(output_dir), "-j", str(self.jobs)]
+        if sys.platform.startswith("linux"):
+            # Don't start new jobs while the machine is already overloaded
+            ninja_command += ["-l", str(self.jobs * 1.5)]
+        ninja_command += libs_to_build
 
         # Run the ninja command
         try:
-            subprocess.run(ninja_command, check=True)
+            self.run_ninja(ninja_command)
             colored_print(f"Successfully built targets for {self.platform} {arch}", Colors.OKGREEN)
         except subprocess.CalledProcessError as e:
             colored_print(f"Error: Build failed for {self.platform} {arch}", Colors.FAIL)
@@ -634,8 +893,15 @@ class SkiaBuildScript:
             print(f"Error details: {e}")
             sys.exit(1)
 
+    def run_ninja(self, ninja_command):
+        """Run ninja with condensed progress output, or untouched with --verbose."""
+        if self.verbose:
+            subprocess.run(ninja_command, check=True)
+        else:
+            run_streaming(ninja_command)
+
     def move_libs(self, arch: str):
-        src_dir = TMP_DIR / f"{self.platform}_{self.config}_{arch}_{self.variant}"
+        src_dir = self.get_build_dir(arch)
         lib_dir = self.get_lib_dir(self.platform)
         if self.platform == "mac":
             dest_dir = lib_dir / self.config / (arch if arch != "universal" else "")
@@ -662,12 +928,13 @@ class SkiaBuildScript:
             src_file = src_dir / lib
             dest_file = dest_dir / lib
             if src_file.exists():
-                shutil.copy2(str(src_file), str(dest_file))
+                # Hardlink rather than copy+delete: no data is copied and the build
+                # output stays in place, so an unchanged rebuild is a ninja no-op
+                link_or_copy(src_file, dest_file)
                 colored_print(f"Copied {lib} to {dest_dir}", Colors.OKGREEN)
                 # Strip arm64e if requested (iOS/visionOS only)
                 if self.strip_arm64e and self.platform in ["ios", "visionos"]:
                     self.strip_arm64e_from_library(dest_file)
-                src_file.unlink()
             else:
                 colored_print(f"Warning: {lib} not found in {src_dir}", Colors.WARNING)
 
@@ -681,7 +948,7 @@ class SkiaBuildScript:
                     src_file = src_dir / lib
                 dest_file = dest_dir / lib
                 if src_file.exists():
-                    shutil.copy2(str(src_file), str(dest_file))
+                    link_or_copy(src_file, dest_file)
                     colored_print(f"Copied {lib} (Dawn) to {dest_dir}", Colors.OKGREEN)
                     # Strip arm64e if requested (iOS/visionOS only)
                     if self.strip_arm64e and self.platform in ["ios", "visionos"]:
@@ -746,7 +1013,7 @@ class SkiaBuildScript:
                     colored_print(f"Created universal file: {lib} (Dawn)", Colors.OKGREEN)
                 elif len(input_libs) == 1:
                     # Only one arch available, just copy it
-                    shutil.copy2(input_libs[0], str(dest_dir / lib))
+                    link_or_copy(input_libs[0], dest_dir / lib)
                     colored_print(f"Copied single-arch file: {lib} (Dawn)", Colors.WARNING)
 
         # Remove architecture-specific folders
@@ -845,24 +1112,40 @@ class SkiaBuildScript:
         colored_print(f"Packaging headers to {dest_dir}...", Colors.OKBLUE)
         dest_dir.mkdir(parents=True, exist_ok=True)
 
-        for dir_path in PACKAGE_DIRS:
-            src_path = SKIA_SRC_DIR / dir_path
-            if src_path.exists() and src_path.is_dir():
-                for root, dirs, files in os.walk(src_path):
-                    # Remove excluded directories
-                    dirs[:] = [d for d in dirs if d not in DONT_PACKAGE]
-
-                    for file in files:
-                        if file.endswith('.h'):
-                            src_file = Path(root) / file
-                            rel_path = src_file.relative_to(SKIA_SRC_DIR)
-
-                            # Check if the file is in an excluded directory
-                            if not any(exclude in rel_path.parts for exclude in DONT_PACKAGE):
-                                dest_file = dest_dir / rel_path
-                                dest_file.parent.mkdir(parents=True, exist_ok=True)
-                                shutil.copy2(src_file, dest_file)
-                                # print(f"Copied {rel_path} to {dest_file}")
+        # Each directory is an independent, I/O-bound tree walk, so copy them concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(PACKAGE_DIRS))) as executor:
+            futures = {executor.submit(self.package_header_dir, dir_path, dest_dir): dir_path
+                       for dir_path in PACKAGE_DIRS}
+            for future in as_completed(futures):
+                count = future.result()
+                if count:
+                    colored_print(f"  Packaged {count} headers from {futures[future]}", Colors.OKCYAN)
+
+    def package_header_dir(self, dir_path, dest_dir):
+        """Copy the changed headers from one PACKAGE_DIRS entry, returning the number copied."""
+        count = 0
+        src_path = SKIA_SRC_DIR / dir_path
+        if src_path.exists() and src_path.is_dir():
+            for root, dirs, files in os.walk(src_path):
+                # Remove excluded and junk directories before descending into them
+                dirs[:] = [d for d in dirs if d not in DONT_PACKAGE and not is_junk_entry(d)]
+
+                for file in files:
+                    if file.endswith('.h'):
+                        src_file = Path(root) / file
+                        rel_path = src_file.relative_to(SKIA_SRC_DIR)
+
+                        # Check if the file is in an excluded directory
+                        if not any(exclude in rel_path.parts for exclude in DONT_PACKAGE):
+                            dest_file = dest_dir / rel_path
+                            # Skip headers unchanged since the last packaging run
+                            if is_up_to_date(src_file, dest_file):
+                                continue
+                            dest_file.parent.mkdir(parents=True, exist_ok=True)
+                            link_or_copy(src_file, dest_file)
+                            count += 1
+                            # print(f"Copied {rel_path} to {dest_file}")
+        return count
 
     def package_icu_data(self, dest_dir):
         """Copy ICU data file (icudtl.dat) to package directory."""
@@ -879,7 +1162,7 @@ class SkiaBuildScript:
 
         dest_dir.mkdir(parents=True, exist_ok=True)
         icu_data_dest = dest_dir / "icudtl.dat"
-        shutil.copy2(icu_data_src, icu_data_dest)
+        link_or_copy(icu_data_src, icu_data_dest)
         colored_print(f"Copied ICU data file to {icu_data_dest}", Colors.OKGREEN)
 
     def package_generated_dawn_headers(self, build_dir, dest_dir):
@@ -891,11 +1174,7 @@ class SkiaBuildScript:
         gen_dawn_dir = gen_include_dir / "dawn"
         if gen_dawn_dir.exists():
             colored_print(f"Packaging generated Dawn headers from {gen_dawn_dir}...", Colors.OKBLUE)
-            dest_dawn_dir = dest_dir / "dawn"
-            dest_dawn_dir.mkdir(parents=True, exist_ok=True)
-            for file in gen_dawn_dir.glob("*.h"):
-                shutil.copy2(file, dest_dawn_dir / file.name)
-                colored_print(f"  Copied dawn/{file.name}", Colors.OKCYAN)
+            self.copy_header_files(gen_dawn_dir, dest_dir / "dawn")
         else:
             # Fallback: try to copy from existing macOS build (headers are platform-agnostic)
             colored_print(f"Dawn headers not found in build output, trying fallback...", Colors.WARNING)
@@ -906,11 +1185,16 @@ class SkiaBuildScript:
         gen_webgpu_dir = gen_include_dir / "webgpu"
         if gen_webgpu_dir.exists():
             colored_print(f"Packaging generated WebGPU headers from {gen_webgpu_dir}...", Colors.OKBLUE)
-            dest_webgpu_dir = dest_dir / "webgpu"
-            dest_webgpu_dir.mkdir(parents=True, exist_ok=True)
-            for file in gen_webgpu_dir.glob("*.h"):
-                shutil.copy2(file, dest_webgpu_dir / file.name)
-                colored_print(f"  Copied webgpu/{file.name}", Colors.OKCYAN)
+            self.copy_header_files(gen_webgpu_dir, dest_dir / "webgpu")
+
+    def copy_header_files(self, src_dir, dest_dir):
+        """Copy the *.h files directly inside src_dir to dest_dir using a single directory scan."""
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".h") and entry.is_file():
+                    link_or_copy(entry.path, dest_dir / entry.name)
+                    colored_print(f"  Copied {dest_dir.name}/{entry.name}", Colors.OKCYAN)
 
     def copy_dawn_headers_from_macos(self, dest_dir):
         """Fallback: Copy Dawn headers from existing macOS build.
@@ -950,20 +1234,12 @@ class SkiaBuildScript:
         colored_print(f"Copying Dawn headers from macOS build: {source_dir}", Colors.OKBLUE)
 
         # Copy dawn/*.h
-        dest_dawn_dir = dest_dir / "dawn"
-        dest_dawn_dir.mkdir(parents=True, exist_ok=True)
-        for file in source_dir.glob("*.h"):
-            shutil.copy2(file, dest_dawn_dir / file.name)
-            colored_print(f"  Copied dawn/{file.name}", Colors.OKCYAN)
+        self.copy_header_files(source_dir, dest_dir / "dawn")
 
         # Copy webgpu/*.h if exists in sibling directory
         source_webgpu_dir = source_dir.parent / "webgpu"
         if source_webgpu_dir.exists():
-            dest_webgpu_dir = dest_dir / "webgpu"
-            dest_webgpu_dir.mkdir(parents=True, exist_ok=True)
-            for file in source_webgpu_dir.glob("*.h"):
-                shutil.copy2(file, dest_webgpu_dir / file.name)
-                colored_print(f"  Copied webgpu/{file.name}", Colors.OKCYAN)
+            self.copy_header_files(source_webgpu_dir, dest_dir / "webgpu")
 
 
 #     def create_swift_package(self):
@@ -1027,37 +1303,50 @@ class SkiaBuildScript:
 
     def cleanup(self):
         for arch in self.archs:
-            shutil.rmtree(TMP_DIR / f"{self.platform}_{self.config}_{arch}_{self.variant}", ignore_errors=True)
+            shutil.rmtree(self.get_build_dir(arch), ignore_errors=True)
         colored_print("Cleaned up temporary directories", Colors.OKBLUE)
 
     def setup_skia_repo(self):
         colored_print(f"Setting up Skia repository (branch: {self.branch})...", Colors.OKBLUE)
         if not SKIA_SRC_DIR.exists():
-            clone_command = ["git", "clone"]
+            clone_command = [*GIT, "clone"]
             if self.shallow_clone:
-                clone_command.extend(["--depth", "1"])
+                clone_command.extend(["--depth", "1", "--single-branch", "--no-tags"])
+            if self.use_mirror:
+                # Borrow objects from the mirror, then copy them so the checkout doesn't depend on it
+                self.update_skia_mirror()
+                clone_command.extend(["--reference-if-able", str(SKIA_MIRROR), "--dissociate"])
             clone_command.extend(["--branch", self.branch, SKIA_GIT_URL, str(SKIA_SRC_DIR)])
-            subprocess.run(clone_command, check=True)
+            run_captured(clone_command)
         else:
-            os.chdir(SKIA_SRC_DIR)
-            fetch_command = ["git", "fetch"]
+            # Fetch straight into the remote-tracking ref and reset to it, no separate checkout needed
+            remote_ref = f"refs/remotes/origin/{self.branch}"
+            fetch_command = [*GIT, "-C", str(SKIA_SRC_DIR), "fetch", "--prune"]
             if self.shallow_clone:
-                fetch_command.extend(["--depth", "1"])
-            fetch_command.extend(["origin", self.branch])
-            subprocess.run(fetch_command, check=True)
-            subprocess.run(["git", "checkout", self.branch], check=True)
-            subprocess.run(["git", "reset", "--hard", f"origin/{self.branch}"], check=True)
+                fetch_command.extend(["--depth", "1", "--no-tags"])
+            fetch_command.extend(["origin", f"+refs/heads/{self.branch}:{remote_ref}"])
+            run_captured(fetch_command)
+            run_captured(["git", "-C", str(SKIA_SRC_DIR), "reset", "--hard", remote_ref])
         colored_print("Skia repository setup complete.", Colors.OKGREEN)
 
+    def update_skia_mirror(self):
+        """Create or refresh the bare Skia mirror at SKIA_MIRROR."""
+        if not SKIA_MIRROR.exists():
+            colored_print(f"Creating Skia mirror at {SKIA_MIRROR}...", Colors.OKBLUE)
+            run_captured([*GIT, "clone", "--bare", "--no-tags", SKIA_GIT_URL, str(SKIA_MIRROR)])
+        else:
+            colored_print(f"Updating Skia mirror at {SKIA_MIRROR}...", Colors.OKBLUE)
+            run_captured([*GIT, "-C", str(SKIA_MIRROR), "fetch", "--prune", "--no-tags",
+                          "origin", "+refs/heads/*:refs/heads/*"])
+
     def setup_gn_for_windows_arm64(self):
         """Download x64 GN binary for Windows ARM64 (works under emulation)."""
-        import platform
         import urllib.request
         import zipfile
         import io
 
         # Only needed on Windows ARM64
-        if sys.platform != "win32" or platform.machine().lower() not in ("arm64", "aarch64"):
+        if sys.platform != "win32" or host_arch() != "arm64":
             return
 
         gn_path = SKIA_SRC_DIR / "bin" / "gn.exe"
@@ -1083,17 +1372,18 @@ class SkiaBuildScript:
             colored_print(f"Warning: Failed to download GN: {e}", Colors.WARNING)
 
     def generate_gn_args_summary(self, arch: str):
-        if self.variant == "cpu":
-            gn_args = BASIC_GN_ARGS + PLATFORM_GN_ARGS_CPU[self.platform] + CPU_ONLY_GN_ARGS
+        # Prefer the exact args.gn the build was generated from
+        args_file = self.get_build_dir(arch) / "args.gn"
+        if args_file.exists():
+            gn_args = args_file.read_text()
         else:
-            gn_args = BASIC_GN_ARGS + PLATFORM_GN_ARGS[self.platform]
-        gn_args += RELEASE_GN_ARGS
-        gn_args += f"""
-        is_debug = {"true" if self.config == 'Debug' else "false"}
-        is_official_build = {"false" if self.config == 'Debug' else "true"}
-        target_cpu = "{arch}"
-        variant = "{self.variant}"
-        """
+            gn_args = BASE_GN_ARGS[(self.variant, self.platform)]
+            gn_args += f"""
+            is_debug = {"true" if self.config == 'Debug' else "false"}
+            is_official_build = {"false" if self.config == 'Debug' else "true"}
+            target_cpu = "{arch}"
+            variant = "{self.variant}"
+            """
         # Remove leading whitespace from each line while preserving structure
         lines = [line.strip() for line in gn_args.strip().splitlines()]
         return '\n'.join(line for line in lines if line)
@@ -1119,23 +1409,25 @@ class SkiaBuildScript:
                 f.write("\n")
         colored_print(f"GN args summary written to {summary_file}", Colors.OKGREEN)
 
-    def modify_deps(self):
+    def modify_deps(self, dest_path=None, exclude_deps=EXCLUDE_DEPS):
+        """Comment out excluded dependencies from DEPS, writing to dest_path (default: in place)."""
         deps_path = SKIA_SRC_DIR / "DEPS"
         if not deps_path.exists():
             colored_print(f"Error: {deps_path} not found.", Colors.FAIL)
             sys.exit(1)
+        dest_path = dest_path or deps_path
 
         with open(deps_path, "r") as file:
             lines = file.readlines()
 
-        with open(deps_path, "w") as file:
+        with open(dest_path, "w") as file:
             for line in lines:
-                if not any(exclude in line for exclude in EXCLUDE_DEPS):
+                if not any(exclude in line for exclude in exclude_deps):
                     file.write(line)
                 else:
                     file.write(f"# {line}")
 
-        colored_print(f"Modified {deps_path} to exclude specified dependencies.", Colors.OKGREEN)
+        colored_print(f"Wrote {dest_path} excluding specified dependencies.", Colors.OKGREEN)
 
     def patch_activate_emsdk(self):
         if not ACTIVATE_EMSDK_PATH.exists():
@@ -1159,15 +1451,72 @@ class SkiaBuildScript:
         if not patches_dir.exists():
             return
 
-        os.chdir(SKIA_SRC_DIR)
+        # Collect .patch files and apply_*.py scripts in a single directory scan
+        patch_files = []
+        patch_scripts = []
+        with os.scandir(patches_dir) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if entry.name.endswith(".patch"):
+                    patch_files.append(Path(entry.path))
+                elif entry.name.startswith("apply_") and entry.name.endswith(".py"):
+                    patch_scripts.append(Path(entry.path))
+        patch_files.sort()
+        patch_scripts.sort()
+
+        git_apply = ["git", "-C", str(SKIA_SRC_DIR), "apply"]
+
+        # Common case on a fresh checkout: none of the patches are applied yet, so check and
+        # apply them all with a single git invocation each. The patches are concatenated and
+        # fed on stdin so git applies them cumulatively and atomically in both steps; given
+        # separate files it would check each against the original tree and stop partway.
+        if patch_files:
+            combined = b"".join(f.read_bytes().rstrip(b"\n") + b"\n" for f in patch_files)
+            if subprocess.run(git_apply + ["--check"], input=combined, capture_output=True).returncode == 0:
+                colored_print(f"Applying {len(patch_files)} patches: "
+                              f"{', '.join(f.name for f in patch_files)}", Colors.OKBLUE)
+                try:
+                    subprocess.run(git_apply, input=combined, capture_output=True, check=True)
+                    colored_print("  Applied patches successfully.", Colors.OKGREEN)
+                    patch_files = []
+                except subprocess.CalledProcessError as e:
+                    colored_print(f"  Warning: Failed to apply patches together, retrying one at a time: {e}",
+                                  Colors.WARNING)
+
+        # Otherwise some are already applied (or broken), so handle them one at a time.
+        # Patches touching disjoint files are applied concurrently. Patches that share
+        # a file are grouped together and applied in name order within the group.
+        groups = []  # (paths, patch files)
+        for patch_file in patch_files:
+            paths = set(PATCH_PATH_RE.findall(patch_file.read_text(errors="replace")))
+            overlapping = [group for group in groups if group[0] & paths]
+            merged_paths = paths.union(*(group[0] for group in overlapping))
+            merged_files = sorted([f for group in overlapping for f in group[1]] + [patch_file])
+            groups = [group for group in groups if group not in overlapping]
+            groups.append((merged_paths, merged_files))
+
+        if groups:
+            with ThreadPoolExecutor(max_workers=min(len(groups), os.cpu_count() or 1)) as executor:
+                list(executor.map(self.apply_patch_group, [files for _, files in groups]))
+
+        # Apply Python patch scripts (for complex patches that can't use git diff)
+        for patch_script in patch_scripts:
+            colored_print(f"Running patch script: {patch_script.name}", Colors.OKBLUE)
+            try:
+                subprocess.run([sys.executable, str(patch_script), str(SKIA_SRC_DIR)], check=True)
+                colored_print(f"  Ran {patch_script.name} successfully.", Colors.OKGREEN)
+            except subprocess.CalledProcessError as e:
+                colored_print(f"  Warning: Failed to run {patch_script.name}: {e}", Colors.WARNING)
 
-        # Apply .patch files using git apply
-        for patch_file in sorted(patches_dir.glob("*.patch")):
+    def apply_patch_group(self, patch_files):
+        """Apply a group of patches in order, skipping any that are already applied."""
+        for patch_file in patch_files:
             colored_print(f"Applying patch: {patch_file.name}", Colors.OKBLUE)
             try:
                 # Check if patch is already applied
                 result = subprocess.run(
-                    ["git", "apply", "--check", "--reverse", str(patch_file)],
+                    ["git", "-C", str(SKIA_SRC_DIR), "apply", "--check", "--reverse", str(patch_file)],
                     capture_output=True, text=True
                 )
                 if result.returncode == 0:
@@ -1175,24 +1524,22 @@ class SkiaBuildScript:
                     continue
 
                 # Apply the patch
-                subprocess.run(["git", "apply", str(patch_file)], check=True)
+                run_captured(["git", "-C", str(SKIA_SRC_DIR), "apply", str(patch_file)])
                 colored_print(f"  Applied {patch_file.name} successfully.", Colors.OKGREEN)
             except subprocess.CalledProcessError as e:
                 colored_print(f"  Warning: Failed to apply {patch_file.name}: {e}", Colors.WARNING)
 
-        # Apply Python patch scripts (for complex patches that can't use git diff)
-        for patch_script in sorted(patches_dir.glob("apply_*.py")):
-            colored_print(f"Running patch script: {patch_script.name}", Colors.OKBLUE)
-            try:
-                subprocess.run([sys.executable, str(patch_script), str(SKIA_SRC_DIR)], check=True)
-                colored_print(f"  Ran {patch_script.name} successfully.", Colors.OKGREEN)
-            except subprocess.CalledProcessError as e:
-                colored_print(f"  Warning: Failed to run {patch_script.name}: {e}", Colors.WARNING)
-
     def run(self):
         self.parse_arguments()
-        self.setup_depot_tools()
-        self.setup_skia_repo()
+
+        # depot_tools and the Skia checkout are independent network fetches, so overlap them
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            depot_tools_future = executor.submit(self.setup_depot_tools)
+            skia_repo_future = executor.submit(self.setup_skia_repo)
+            depot_tools_future.result()
+            skia_repo_future.result()
+        # Only touch PATH once the workers are done, so it can't change under a concurrent git spawn
+        os.environ["PATH"] = os.pathsep.join([str(DEPOT_TOOLS_PATH), os.environ.get("PATH", "")])
         self.setup_gn_for_windows_arm64()
 
         # if self.config == "Release":
@@ -1203,42 +1550,46 @@ class SkiaBuildScript:
         self.sync_deps()
         self.apply_patches()
 
-        if "universal" in self.archs or self.xcframework:
-            self.archs = ["x86_64", "arm64"]
-
-        for arch in self.archs:
-            self.generate_gn_args(arch)
-            self.build_skia(arch)
-            self.move_libs(arch)
+        # Headers only depend on the patched source tree, so package them while ninja runs
+        with ThreadPoolExecutor(max_workers=1) as packaging_pool:
+            headers_future = packaging_pool.submit(self.package_headers, BASE_DIR / "include")
 
-        if self.platform == "mac" and self.archs == ["x86_64", "arm64"]:
-            self.create_universal_binary()
+            if "universal" in self.archs or self.xcframework:
+                self.archs = ["x86_64", "arm64"]
 
-        if self.xcframework:
-            # Build for macOS
-            self.combine_libraries("mac", "universal")
-
-            # Build for iOS
-            self.platform = "ios"
-            self.archs = ["x86_64", "arm64"]
             for arch in self.archs:
                 self.generate_gn_args(arch)
                 self.build_skia(arch)
                 self.move_libs(arch)
-                self.combine_libraries("ios", arch)
 
-            self.package_headers(BASE_DIR / "include")
-            self.package_icu_data(BASE_DIR / "share")
-            self.create_xcframework(with_headers=True)
-        else:
-            self.package_headers(BASE_DIR / "include")
-            self.package_icu_data(BASE_DIR / "share")
+            if self.platform == "mac" and self.archs == ["x86_64", "arm64"]:
+                self.create_universal_binary()
+
+            if self.xcframework:
+                # Build for macOS
+                self.combine_libraries("mac", "universal")
+
+                # Build for iOS
+                self.platform = "ios"
+                self.archs = ["x86_64", "arm64"]
+                for arch in self.archs:
+                    self.generate_gn_args(arch)
+                    self.build_skia(arch)
+                    self.move_libs(arch)
+                    self.combine_libraries("ios", arch)
+
+                headers_future.result()
+                self.package_icu_data(BASE_DIR / "share")
+                self.create_xcframework(with_headers=True)
+            else:
+                headers_future.result()
+                self.package_icu_data(BASE_DIR / "share")
 
         # Copy generated Dawn headers (for Graphite WebGPU backend)
         if self.variant == "gpu":
             # Use the first arch's build dir for generated headers (they're the same across archs)
             first_arch = self.archs[0]
-            build_dir = TMP_DIR / f"{self.platform}_{self.config}_{first_arch}_{self.variant}"
+            build_dir = self.get_build_dir(first_arch)
             self.package_generated_dawn_headers(build_dir, BASE_DIR / "include")
 
         self.write_gn_args_summary()
@@ -1250,6 +1601,10 @@ class SkiaBuildScript:
         colored_print(f"Build completed successfully for {self.platform} {self.config} "
                      f"configuration with architectures: {', '.join(self.archs)}", 
                      Colors.OKGREEN)
+        if self.cc_wrapper:
+            cache_env = "SCCACHE_DIR" if self.cc_wrapper == "sccache" else "CCACHE_DIR"
+            cache_dir = os.environ.get(cache_env, f"{self.cc_wrapper} default location")
+            colored_print(f"Compiler cache: {self.cc_wrapper} ({cache_dir})", Colors.OKCYAN)
 
     def create_all_platforms_zip(self):
         """Create a zip file containing headers and libraries for all platforms."""
@@ -1265,31 +1620,29 @@ class SkiaBuildScript:
         try:
             import zipfile
             with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                def add_directory(directory):
+                    for root, dirs, files in os.walk(directory):
+                        dirs[:] = [d for d in dirs if not is_junk_entry(d)]
+                        for file in files:
+                            if is_junk_entry(file):
+                                continue
+                            file_path = Path(root) / file
+                            arcname = file_path.relative_to(BASE_DIR)
+                            zipf.write(file_path, arcname)
+
                 # Add include directory
-                for root, _, files in os.walk(include_dir):
-                    for file in files:
-                        file_path = Path(root) / file
-                        arcname = file_path.relative_to(BASE_DIR)
-                        zipf.write(file_path, arcname)
+                add_directory(include_dir)
 
                 # Add share directory (ICU data, etc.)
                 share_dir = BASE_DIR / "share"
                 if share_dir.exists():
-                    for root, _, files in os.walk(share_dir):
-                        for file in files:
-                            file_path = Path(root) / file
-                            arcname = file_path.relative_to(BASE_DIR)
-                            zipf.write(file_path, arcname)
+                    add_directory(share_dir)
 
                 # Add all platform lib directories for current variant
                 for platform in ["mac", "ios", "visionos", "win", "linux", "wasm"]:
                     lib_dir = self.get_lib_dir(platform)
                     if lib_dir.exists():
-                        for root, _, files in os.walk(lib_dir):
-                            for file in files:
-                                file_path = Path(root) / file
-                                arcname = file_path.relative_to(BASE_DIR)
-                                zipf.write(file_path, arcname)
+                        add_directory(lib_dir)
                     else:
                         colored_print(f"Warning: {platform} library directory not found",
                                     Colors.WARNING)